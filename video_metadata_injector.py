@@ -24,45 +24,437 @@ import sys
 import os
 import json
 import argparse
+import errno
+import asyncio
 import logging
+import logging.handlers
+import queue
+import atexit
+import functools
 import time
-from pathlib import Path
+import math
+import shutil
+import tempfile
+import xml.etree.ElementTree as ET
 from typing import Dict, List, Tuple, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import hashlib
+import platform
+import ssl
+
+try:  # Dépendance optionnelle: réécriture directe des atomes MP4/MOV (sans remux)
+    from mutagen.mp4 import MP4, MP4FreeForm
+except ImportError:
+    MP4 = None
+
+try:  # Dépendance optionnelle: hash BLAKE3 (SIMD AVX-512/NEON)
+    import blake3
+except ImportError:
+    blake3 = None
+
+# Empreinte rapide: BLAKE3 si disponible (pas besoin de la robustesse SHA-256)
+FINGERPRINT_ALGORITHM = 'blake3' if blake3 is not None else 'sha256'
 
 # ═══════════════════════════════════════════════════════════════════════════
 # CONFIGURATION GLOBALE
 # ═══════════════════════════════════════════════════════════════════════════
 
 VERSION = "2.0.0"
-MAX_WORKERS = os.cpu_count() or 4  # Threads parallèles = nombre de CPU
-BUFFER_SIZE = 8192  # Buffer I/O optimisé
+MAX_WORKERS = max(1, (os.cpu_count() or 4) // 2)  # Moitié des CPU (FFmpeg est lui-même multi-thread)
+MAX_FFMPEG_THREADS = 64  # Borne haute du nombre de threads par processus FFmpeg
+FFMPEG_THREADS_ENV = 'VIDEO_METADATA_FFMPEG_THREADS'  # Surcharge par variable d'environnement
+
+# subprocess n'utilise posix_spawn (plus rapide que fork+exec pour un parent à
+# fort RSS) que si close_fds=False et l'exécutable donné en chemin absolu.
+# Sans risque: les descripteurs Python sont non héritables par défaut (PEP 446)
+SPAWN_OPTIONS = {'close_fds': False} if os.name == 'posix' else {}
+BUFFER_SIZE = 1024 * 1024  # Buffer I/O optimisé (1 MiB: amortit le coût Python par bloc)
+SMALL_FILE_THRESHOLD = 64 * 1024 * 1024  # Fichiers courts: regroupés dans une seule invocation FFmpeg
+FFMPEG_GROUP_SIZE = 8  # Nombre max de fichiers par invocation FFmpeg groupée
+HASH_ALGORITHM = 'sha256'  # Algorithme du hash complet par défaut (--strict-hash, --hash-algorithm blake3)
+FINGERPRINT_CHUNK_SIZE = 1024 * 1024  # Octets lus en début et en fin de fichier pour l'empreinte rapide
 LOG_FORMAT = '%(asctime)s | %(levelname)-8s | %(message)s'
 DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 
+# Extensions vidéo reconnues lors du parcours de dossiers (sans le point)
+VIDEO_EXTENSIONS = frozenset({'mp4', 'avi', 'mkv', 'mov', 'wmv', 'flv', 'webm', 'm4v'})
+
+# Conteneurs éligibles à l'injection directe (sans remux FFmpeg)
+MP4_EXTENSIONS = {'.mp4', '.m4v', '.mov'}
+MATROSKA_EXTENSIONS = {'.mkv', '.webm'}
+MP4_TOP_LEVEL_ATOMS = {b'ftyp', b'moov', b'mdat', b'free', b'skip', b'wide'}
+EBML_MAGIC = b'\x1a\x45\xdf\xa3'
+
+# Correspondance clés FFmpeg -> atomes iTunes (identique au muxer mov de FFmpeg)
+MP4_TAG_ATOMS = {
+    'title': '\xa9nam',
+    'artist': '\xa9ART',
+    'album_artist': 'aART',
+    'album': '\xa9alb',
+    'composer': '\xa9wrt',
+    'comment': '\xa9cmt',
+    'genre': '\xa9gen',
+    'copyright': 'cprt',
+    'date': '\xa9day',
+    'encoder': '\xa9too',
+    'description': 'desc',
+    'synopsis': 'ldes',
+    'grouping': '\xa9grp',
+    'lyrics': '\xa9lyr',
+    'show': 'tvsh',
+    'episode_id': 'tven',
+    'network': 'tvnn',
+}
+MP4_FREEFORM_PREFIX = '----:com.apple.iTunes:'
+# Sens inverse (lecture des tags existants), plus les atomes numériques nommés comme FFmpeg
+MP4_ATOM_TAGS = {
+    **{atom: key for key, atom in MP4_TAG_ATOMS.items()},
+    'trkn': 'track',
+    'disk': 'disc',
+}
+
+# mkvtoolnix: 0 = succès, 1 = succès avec avertissements, 2 = erreur
+MKVTOOLNIX_OK_RETURNCODES = (0, 1)
+
+# Clés de métadonnées globales reconnues par les muxers FFmpeg (comparaison en minuscules)
+_FFMPEG_STANDARD_META_KEYS = frozenset(MP4_TAG_ATOMS) | frozenset({
+    'author', 'compilation', 'creation_time', 'disc',
+    'encoded_by', 'filename', 'keywords', 'language', 'location',
+    'performer', 'publisher', 'rating', 'service_name', 'service_provider',
+    'subtitle', 'track', 'year',
+})
+
+# Champs proposés par le mode interactif (et utilisés dans les exemples de l'aide)
+METADATA_FIELD_SUGGESTIONS = (
+    ('title', 'Titre'),
+    ('artist', 'Créateur/Artiste'),
+    ('description', 'Description'),
+    ('tags', 'Tags (séparés par virgules)'),
+    ('hashtags', 'Hashtags (ex: #video #tutorial)'),
+    ('category', 'Catégorie'),
+    ('project', 'Nom du projet'),
+    ('comment', 'Commentaire'),
+    ('copyright', 'Copyright'),
+    ('date', 'Date (YYYY-MM-DD)'),
+)
+
+# Clés acceptées sans avertissement: standard FFmpeg + champs suggérés par l'application
+_KNOWN_METADATA_KEYS = _FFMPEG_STANDARD_META_KEYS | frozenset(key for key, _ in METADATA_FIELD_SUGGESTIONS)
+
 # ═══════════════════════════════════════════════════════════════════════════
 # CONFIGURATION DU LOGGING
 # ═══════════════════════════════════════════════════════════════════════════
 
-logging.basicConfig(
-    level=logging.INFO,
-    format=LOG_FORMAT,
-    datefmt=DATE_FORMAT,
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('video_metadata.log', encoding='utf-8')
-    ]
-)
+# Le fichier de log est écrit par un thread dédié: les threads workers ne font
+# que déposer les records dans une file, sans se disputer le verrou du fichier.
+# La console reste synchrone pour ne pas se mélanger aux print() interactifs.
+_log_queue = queue.SimpleQueue()
+_log_formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+
+_console_handler = logging.StreamHandler(sys.stdout)
+_console_handler.setFormatter(_log_formatter)
+_file_handler = logging.FileHandler('video_metadata.log', encoding='utf-8')
+_file_handler.setFormatter(_log_formatter)
+
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+logging.basicConfig(level=logging.INFO, handlers=[_console_handler, _queue_handler])
+
+_log_listener = logging.handlers.QueueListener(_log_queue, _file_handler, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Vide la file avant la fermeture des handlers
+
 logger = logging.getLogger(__name__)
 
 
+def _ffmpeg_threads_per_invocation(n_workers: int) -> int:
+    """
+    Calcule le budget de threads par processus FFmpeg
+    
+    Répartit les CPU entre les workers pour que workers × threads ≈ nombre de CPU,
+    au lieu de laisser chaque FFmpeg lancer ~min(CPU, 16) threads (-threads 0)
+    """
+    n_workers = max(1, n_workers)
+    return max(1, (os.cpu_count() or n_workers) // n_workers)
+
+
+def _new_hash(algorithm: str = HASH_ALGORITHM):
+    """
+    Crée un objet de hash, en privilégiant le backend OpenSSL
+    
+    hashlib.new() passe par l'EVP d'OpenSSL (>= 1.1.1), qui utilise
+    automatiquement SHA-NI (x86) ou les extensions crypto ARMv8 si le CPU
+    les propose. 'blake3' utilise le module optionnel blake3.
+    """
+    if algorithm == 'blake3':
+        if blake3 is None:
+            raise ValueError("BLAKE3 indisponible (pip install blake3)")
+        return blake3.blake3()
+    return hashlib.new(algorithm)
+
+
+def _cpu_has_sha_extensions() -> Optional[bool]:
+    """
+    Détecte les instructions SHA matérielles (SHA-NI x86, SHA2 ARMv8)
+    
+    Returns:
+        True/False si détectable (Linux), None sinon
+    """
+    try:
+        with open('/proc/cpuinfo', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                if line.startswith(('flags', 'Features')):
+                    flags = line.partition(':')[2].split()
+                    return 'sha_ni' in flags or 'sha2' in flags
+    except OSError:
+        pass
+    if sys.platform == 'darwin' and platform.machine() == 'arm64':
+        return True  # Apple Silicon: extensions crypto ARMv8 toujours présentes
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _find_executable(name: str) -> Optional[str]:
+    """Chemin absolu d'un exécutable du PATH, None si absent (recherche mémorisée)"""
+    return shutil.which(name)
+
+
+def _resolve_executable(name: str) -> str:
+    """Chemin absolu d'un exécutable (requis par le chemin posix_spawn)"""
+    return _find_executable(name) or name
+
+
+def _run_command(
+    cmd: List[str],
+    text: bool = True,
+    ok_returncodes: Tuple[int, ...] = (0,)
+) -> subprocess.CompletedProcess:
+    """
+    Exécute une commande externe (FFmpeg, ffprobe, mkvtoolnix) et capture sa sortie
+    
+    OPTIMISATION: Exécutable résolu en chemin absolu et close_fds=False (POSIX)
+    pour que subprocess passe par posix_spawn au lieu de fork+exec.
+    stdin est fermé: FFmpeg ne lit pas le terminal pendant les traitements parallèles.
+    
+    Args:
+        cmd: Commande et arguments
+        text: Décode stdout/stderr en texte
+        ok_returncodes: Codes de retour considérés comme un succès
+    
+    Raises:
+        subprocess.CalledProcessError: si la commande échoue
+    """
+    result = subprocess.run(
+        [_resolve_executable(cmd[0]), *cmd[1:]],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=text,
+        **SPAWN_OPTIONS
+    )
+    if result.returncode not in ok_returncodes:
+        raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
+    return result
+
+
+async def _run_command_async(cmd: List[str]) -> subprocess.CompletedProcess:
+    """
+    Version asyncio de _run_command (mêmes options de lancement)
+    
+    OPTIMISATION: L'attente du processus est gérée par la boucle d'événements,
+    aucun thread n'est bloqué sur le wait() de chaque FFmpeg.
+    
+    Raises:
+        subprocess.CalledProcessError: si la commande échoue
+    """
+    process = await asyncio.create_subprocess_exec(
+        _resolve_executable(cmd[0]), *cmd[1:],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        **SPAWN_OPTIONS
+    )
+    stdout, stderr = await process.communicate()
+    stdout = stdout.decode('utf-8', errors='replace')
+    stderr = stderr.decode('utf-8', errors='replace')
+    
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, cmd, stdout, stderr)
+    return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+
+
+# Erreurs de copy_file_range signifiant "non supporté ici": repli sur shutil.copyfile
+_COPY_FILE_RANGE_FALLBACK_ERRNOS = {
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ETXTBSY, errno.EBADF
+}
+
+
+def _copy_file_fast(source: str, destination: str) -> None:
+    """
+    Copie un fichier sans faire transiter les données par l'espace utilisateur
+    
+    OPTIMISATION: Sous Linux, os.copy_file_range laisse le noyau copier (ou
+    partager les blocs: reflink sur btrfs/XFS, copie côté serveur en NFS 4.2).
+    Sinon, repli sur shutil.copyfile (sendfile sous Linux, fcopyfile sous macOS).
+    
+    Raises:
+        shutil.SameFileError: si source et destination sont le même fichier
+    """
+    try:
+        if os.path.samefile(source, destination):
+            raise shutil.SameFileError(f"{source!r} et {destination!r} sont le même fichier")
+    except FileNotFoundError:
+        pass  # Destination pas encore créée
+    
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(source, 'rb') as fsrc, open(destination, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break  # Système de fichiers sans support effectif
+                    remaining -= copied
+            if remaining <= 0:
+                return
+        except OSError as e:
+            if e.errno not in _COPY_FILE_RANGE_FALLBACK_ERRNOS:
+                raise
+    
+    shutil.copyfile(source, destination)
+
+
+@functools.lru_cache(maxsize=None)
+def _describe_hash_backend(algorithm: str = HASH_ALGORITHM) -> str:
+    """
+    Décrit le backend de hash effectivement utilisé (pour affichage)
+    
+    Calculé à la demande (lecture de /proc/cpuinfo, objet de hash de test)
+    et mémorisé: seuls les modes qui hashent en paient le coût.
+    """
+    if algorithm == 'blake3':
+        return "BLAKE3 (SIMD)" if blake3 is not None else "BLAKE3 indisponible"
+    
+    # Les objets OpenSSL sont de type _hashlib.HASH, les autres sont les
+    # implémentations intégrées de CPython (sans accélération matérielle)
+    if type(_new_hash(algorithm)).__module__ != '_hashlib':
+        return f"{algorithm} (implémentation intégrée)"
+    
+    openssl_version = ' '.join(ssl.OPENSSL_VERSION.split()[:2])
+    description = f"{algorithm} ({openssl_version}"
+    sha_extensions = _cpu_has_sha_extensions()
+    if sha_extensions is not None:
+        description += ", SHA-NI/ARMv8" if sha_extensions else ", sans SHA-NI"
+    return description + ")"
+
+
+def _get_file_hash(filepath: str, algorithm: str = HASH_ALGORITHM, parallel: bool = False) -> str:
+    """
+    Calcule le hash (SHA256 par défaut) d'un fichier pour vérification d'intégrité
+    
+    OPTIMISATION: Python 3.11+ utilise hashlib.file_digest (boucle lecture/hash
+    en C, GIL relâché). Sinon, lecture par blocs de 1 MiB dans un buffer
+    réutilisé (readinto) pour limiter les allers-retours Python.
+    Les gros blocs gardent la boucle chaude dans OpenSSL (SHA-NI/ARMv8).
+    BLAKE3 hashe le fichier mappé en mémoire, en mode arbre multi-thread
+    si `parallel` (un seul gros fichier), sinon sur un seul thread.
+    
+    Args:
+        filepath: Chemin du fichier
+        algorithm: Nom hashlib ('sha256', ...) ou 'blake3'
+        parallel: BLAKE3 sur tous les CPU (à réserver au hash d'un fichier isolé,
+                  sinon threads par fichier × fichiers en parallèle surchargent les CPU)
+    """
+    if algorithm == 'blake3' and blake3 is not None and hasattr(blake3.blake3, 'update_mmap'):
+        hasher = blake3.blake3(max_threads=blake3.blake3.AUTO if parallel else 1)
+        hasher.update_mmap(filepath)
+        return hasher.hexdigest()
+    
+    with open(filepath, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, lambda: _new_hash(algorithm)).hexdigest()
+        
+        digest = _new_hash(algorithm)
+        buffer = bytearray(BUFFER_SIZE)
+        view = memoryview(buffer)
+        while size := f.readinto(buffer):
+            digest.update(view[:size])
+    return digest.hexdigest()
+
+
+def _get_file_fingerprint(filepath: str) -> str:
+    """
+    Calcule une empreinte rapide d'un fichier: début + fin + taille
+    
+    OPTIMISATION: Ne lit que FINGERPRINT_CHUNK_SIZE octets au début et à la
+    fin du fichier (0.02% d'un fichier de 10 GB), suffisant pour détecter une
+    copie tronquée ou corrompue. Pas une garantie cryptographique: utiliser
+    _get_file_hash (--strict-hash) pour une vérification complète.
+    """
+    digest = _new_hash(FINGERPRINT_ALGORITHM)
+    with open(filepath, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        digest.update(f.read(FINGERPRINT_CHUNK_SIZE))
+        f.seek(max(0, size - FINGERPRINT_CHUNK_SIZE))
+        digest.update(f.read(FINGERPRINT_CHUNK_SIZE))
+    digest.update(size.to_bytes(8, 'little'))
+    return digest.hexdigest()
+
+
+def compute_checksums(
+    files: List[str],
+    strict: bool = False,
+    algorithm: str = HASH_ALGORITHM
+) -> Dict[str, Optional[str]]:
+    """
+    Calcule les empreintes d'intégrité d'une liste de fichiers
+    
+    Fonction de module: aucune dépendance à FFmpeg, utilisable sans construire
+    de processeur (mode --checksum).
+    
+    OPTIMISATION: Fichiers traités en parallèle (ThreadPoolExecutor). hashlib
+    et blake3 relâchent le GIL pendant update() sur de gros blocs, les threads
+    hashent donc réellement en parallèle, sans coût de sérialisation
+    inter-processus. BLAKE3 n'utilise son mode arbre multi-thread que pour un
+    fichier seul: avec plusieurs fichiers, le parallélisme est entre fichiers.
+    
+    Args:
+        files: Chemins des fichiers
+        strict: True = hash complet du fichier, False = empreinte rapide
+                (début + fin + taille)
+        algorithm: Algorithme du hash complet ('sha256' par défaut, ou 'blake3')
+    
+    Returns:
+        Dictionnaire chemin -> empreinte hexadécimale (None en cas d'erreur)
+    """
+    workers = max(1, min(os.cpu_count() or 1, len(files)))
+    if strict:
+        checksum = functools.partial(_get_file_hash, algorithm=algorithm, parallel=len(files) == 1)
+    else:
+        checksum = _get_file_fingerprint
+    
+    def safe_checksum(filepath: str) -> Optional[str]:
+        try:
+            return checksum(filepath)
+        except OSError as e:
+            logger.error(f"Erreur calcul d'empreinte: {e}")
+            return None
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(files, executor.map(safe_checksum, files)))
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # CLASSES DE DONNÉES
 # ═══════════════════════════════════════════════════════════════════════════
 
-@dataclass
+# __slots__ (Python 3.10+): pas de __dict__ par instance, accès aux attributs plus rapide
+DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class VideoProcessingResult:
     """Résultat du traitement d'une vidéo"""
     input_file: str
@@ -72,17 +464,46 @@ class VideoProcessingResult:
     error_message: Optional[str] = None
     file_size_before: int = 0
     file_size_after: int = 0
+    skipped: bool = False  # Sortie déjà à jour: aucun traitement effectué
+    existing_tags: Optional[Dict[str, str]] = None  # Tags lus (source, ou sortie si déjà à jour)
+
+
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
+class JobSpec:
+    """Fichier à traiter, préparé une seule fois par process_batch"""
+    input_file: str
+    output_file: str
+    basename: str
+    size_before: int
+    mtime_before: float
+    container: Optional[str]  # 'mp4' / 'matroska' si injection directe possible, sinon None
+    partial_file: str         # Sortie en cours d'écriture, renommée en output_file si succès
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ProcessingStats:
     """Statistiques globales de traitement"""
     total_files: int = 0
     successful: int = 0
     failed: int = 0
+    skipped: int = 0
     total_duration: float = 0.0
     total_size_before: int = 0
     total_size_after: int = 0
+    
+    def add_result(self, result: VideoProcessingResult) -> 'ProcessingStats':
+        """Agrège un résultat dans les statistiques (utilisable avec functools.reduce)"""
+        self.total_files += 1
+        if result.skipped:
+            self.skipped += 1
+        elif result.success:
+            self.successful += 1
+            self.total_size_before += result.file_size_before
+            self.total_size_after += result.file_size_after
+        else:
+            self.failed += 1
+        self.total_duration += result.duration
+        return self
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -101,27 +522,82 @@ class OptimizedVideoMetadataProcessor:
         - Logging détaillé pour monitoring
     """
     
-    def __init__(self, max_workers: int = MAX_WORKERS, verbose: bool = True):
+    # Vérification FFmpeg partagée entre instances (une seule fois par processus)
+    _ffmpeg_checked: bool = False
+    
+    def __init__(
+        self,
+        max_workers: int = MAX_WORKERS,
+        verbose: bool = True,
+        ffmpeg_threads: Optional[int] = None,
+        inplace: bool = True,
+        skip_up_to_date: bool = True,
+        read_existing: bool = False
+    ):
         """
         Initialisation du processeur
         
         Args:
-            max_workers: Nombre de threads parallèles (défaut: nombre de CPU)
+            max_workers: Nombre de threads parallèles (défaut: moitié des CPU)
             verbose: Mode verbeux pour logs détaillés
+            ffmpeg_threads: Threads par processus FFmpeg (défaut: CPU / workers,
+                            ou variable d'environnement VIDEO_METADATA_FFMPEG_THREADS)
+            inplace: Injection directe dans le conteneur MP4/MKV quand possible
+                     (False = remux FFmpeg systématique)
+            skip_up_to_date: Ignore les fichiers dont la sortie existe déjà avec
+                             les métadonnées demandées (relance idempotente)
+            read_existing: Récupère aussi les tags existants de chaque source
+                           (result.existing_tags): lus par l'injection directe,
+                           ou dans le même passage FFmpeg en cas de remux
         """
-        self.max_workers = max_workers
+        self.max_workers = max(1, max_workers)
         self.verbose = verbose
         self.stats = ProcessingStats()
+        self.ffmpeg_threads = self._resolve_ffmpeg_threads_override(ffmpeg_threads)
+        self.threads_per_invocation = self._threads_for_workers(self.max_workers)
+        self.inplace = inplace
+        self.skip_up_to_date = skip_up_to_date
+        self.read_existing = read_existing
+        self.has_mkvtoolnix = bool(_find_executable('mkvpropedit') and _find_executable('mkvextract'))
         
         logger.info(f"╔{'═' * 78}╗")
         logger.info(f"║ OPTIMIZED VIDEO METADATA PROCESSOR v{VERSION:^42} ║")
         logger.info(f"║ {'Configuration:':^76} ║")
-        logger.info(f"║   • Threads parallèles: {max_workers:<54} ║")
+        logger.info(f"║   • Threads parallèles: {self.max_workers:<54} ║")
+        logger.info(f"║   • Threads par FFmpeg: {self.threads_per_invocation:<54} ║")
         logger.info(f"║   • CPU disponibles: {os.cpu_count():<57} ║")
+        logger.info(f"║   • Injection directe: {self._inplace_backends():<55} ║")
         logger.info(f"║   • Mode: Production                                                    ║")
         logger.info(f"╚{'═' * 78}╝")
         
-        self._check_ffmpeg()
+        if not OptimizedVideoMetadataProcessor._ffmpeg_checked:
+            self._check_ffmpeg()
+    
+    @staticmethod
+    def _resolve_ffmpeg_threads_override(ffmpeg_threads: Optional[int]) -> Optional[int]:
+        """
+        Détermine la surcharge éventuelle du nombre de threads FFmpeg
+        
+        Priorité: argument explicite > variable d'environnement > calcul automatique.
+        La valeur retenue est bornée à [1, MAX_FFMPEG_THREADS].
+        """
+        if ffmpeg_threads is None:
+            env_value = os.environ.get(FFMPEG_THREADS_ENV)
+            if not env_value:
+                return None
+            try:
+                ffmpeg_threads = int(env_value)
+            except ValueError:
+                logger.warning(f"⚠ {FFMPEG_THREADS_ENV} invalide ignorée: {env_value!r}")
+                return None
+        
+        return min(max(1, ffmpeg_threads), MAX_FFMPEG_THREADS)
+    
+    def _threads_for_workers(self, n_workers: int) -> int:
+        """Nombre de threads par processus FFmpeg pour n_workers en parallèle"""
+        if self.ffmpeg_threads is not None:
+            return self.ffmpeg_threads
+        return min(_ffmpeg_threads_per_invocation(n_workers), MAX_FFMPEG_THREADS)
     
     def _check_ffmpeg(self) -> None:
         """
@@ -131,25 +607,33 @@ class OptimizedVideoMetadataProcessor:
             - Décodage vidéo hardware-accelerated
             - SIMD (SSE, AVX) pour traitement parallèle
             - Multi-threading natif
+        
+        OPTIMISATION: La présence est testée via le PATH (shutil.which, sans fork).
+        'ffmpeg -version' n'est lancé qu'en mode verbeux pour lister les capacités.
+        Le résultat est mémorisé au niveau de la classe, et le chemin trouvé est
+        celui que réutilisent ensuite tous les lancements de FFmpeg.
         """
         try:
-            result = subprocess.run(
-                ['ffmpeg', '-version'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                check=True,
-                text=True
-            )
+            ffmpeg_path = _find_executable('ffmpeg')
+            if ffmpeg_path is None:
+                raise FileNotFoundError('ffmpeg')
             
-            version_line = result.stdout.split('\n')[0]
-            logger.info(f"✓ FFmpeg détecté: {version_line}")
+            if self.verbose:
+                result = _run_command([ffmpeg_path, '-version'])
+                
+                version_line = result.stdout.split('\n')[0]
+                logger.info(f"✓ FFmpeg détecté: {version_line}")
+                
+                # Vérification des capacités hardware
+                if 'configuration:' in result.stdout:
+                    if '--enable-cuda' in result.stdout:
+                        logger.info("✓ Accélération GPU CUDA disponible")
+                    if '--enable-opencl' in result.stdout:
+                        logger.info("✓ Accélération OpenCL disponible")
+            else:
+                logger.info(f"✓ FFmpeg détecté: {ffmpeg_path}")
             
-            # Vérification des capacités hardware
-            if 'configuration:' in result.stdout:
-                if '--enable-cuda' in result.stdout:
-                    logger.info("✓ Accélération GPU CUDA disponible")
-                if '--enable-opencl' in result.stdout:
-                    logger.info("✓ Accélération OpenCL disponible")
+            OptimizedVideoMetadataProcessor._ffmpeg_checked = True
                     
         except (subprocess.CalledProcessError, FileNotFoundError):
             logger.error("✗ FFmpeg non trouvé!")
@@ -159,110 +643,754 @@ class OptimizedVideoMetadataProcessor:
             logger.error("  • Linux:   sudo apt install ffmpeg")
             sys.exit(1)
     
-    def _get_file_hash(self, filepath: str) -> str:
-        """Calcule le hash SHA256 d'un fichier pour vérification d'intégrité"""
-        sha256 = hashlib.sha256()
+    def _inplace_backends(self) -> str:
+        """Décrit les moteurs d'injection directe disponibles (pour affichage)"""
+        if not self.inplace:
+            return "désactivée (remux FFmpeg)"
+        backends = []
+        if MP4 is not None:
+            backends.append("MP4/MOV (mutagen)")
+        if self.has_mkvtoolnix:
+            backends.append("MKV/WebM (mkvtoolnix)")
+        return ", ".join(backends) or "indisponible (remux FFmpeg)"
+    
+    @staticmethod
+    def _detect_container(filepath: str) -> Optional[str]:
+        """
+        Détecte le type de conteneur par extension puis signature (magic bytes)
+        
+        Returns:
+            'mp4', 'matroska' ou None si le conteneur n'est pas éligible
+        """
+        extension = os.path.splitext(filepath)[1].lower()
+        if extension not in MP4_EXTENSIONS and extension not in MATROSKA_EXTENSIONS:
+            return None
+        
         with open(filepath, 'rb') as f:
-            while chunk := f.read(BUFFER_SIZE):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+            header = f.read(8)
+        
+        if extension in MP4_EXTENSIONS and header[4:8] in MP4_TOP_LEVEL_ATOMS:
+            return 'mp4'
+        if extension in MATROSKA_EXTENSIONS and header[:4] == EBML_MAGIC:
+            return 'matroska'
+        return None
+    
+    def _inplace_container(self, filepath: str) -> Optional[str]:
+        """Conteneur du fichier si un moteur d'injection directe est disponible"""
+        if not self.inplace:
+            return None
+        container = self._detect_container(filepath)
+        if container == 'mp4' and MP4 is not None:
+            return container
+        if container == 'matroska' and self.has_mkvtoolnix:
+            return container
+        return None
     
-    def _process_single_video(
+    def _inject_metadata_inplace(
         self,
-        input_file: str,
-        output_file: str,
+        path: str,
+        metadata: Dict[str, str],
+        container: str
+    ) -> Optional[Dict[str, str]]:
+        """
+        Injecte les métadonnées directement dans le conteneur, sans remux
+        
+        OPTIMISATION: Seuls les atomes udta/meta (MP4) ou l'élément Tags (MKV)
+        sont réécrits, les données des streams ne sont ni lues ni recopiées.
+        Le coût devient O(taille des métadonnées) au lieu de O(taille du fichier).
+        Les métadonnées existantes sont conservées (équivalent -map_metadata 0).
+        
+        Args:
+            path: Fichier à modifier sur place
+            metadata: Dictionnaire des métadonnées à injecter
+            container: Conteneur détecté à la préparation du job (JobSpec.container)
+        
+        Returns:
+            Tags présents avant l'injection si elle a réussi (vide sans
+            read_existing), None s'il faut passer par FFmpeg
+        """
+        try:
+            if container == 'mp4':
+                return self._inject_mp4_tags(path, metadata, self.read_existing)
+            if container == 'matroska':
+                return self._inject_matroska_tags(path, metadata, self.read_existing)
+        except Exception as e:
+            # Visible: le remux FFmpeg qui suit est bien plus lent que l'injection directe
+            logger.warning(f"⚠ Injection directe impossible ({os.path.basename(path)}), "
+                           f"remux FFmpeg: {e}")
+        return None
+    
+    @staticmethod
+    def _mp4_tag_value(values) -> str:
+        """Valeur d'un atome ilst en texte (atomes libres décodés, trkn/disk en 'n/total')"""
+        if not isinstance(values, list):
+            values = [values]  # cpil, pgap, pcst: booléen seul, pas une liste
+        return ', '.join(
+            value.decode('utf-8', errors='replace') if isinstance(value, bytes)
+            else '/'.join(map(str, value)) if isinstance(value, tuple)
+            else str(value)
+            for value in values
+        )
+    
+    @staticmethod
+    def _inject_mp4_tags(
+        path: str,
+        metadata: Dict[str, str],
+        read_existing: bool = False
+    ) -> Dict[str, str]:
+        """
+        Réécrit l'atome ilst d'un fichier MP4/MOV via mutagen
+        
+        mutagen utilise le padding (atome free) quand il suffit, sinon déplace
+        moov et corrige les offsets stco/co64 sans toucher aux données mdat.
+        Les clés non standard sont écrites en atomes libres (----) iTunes.
+        
+        Returns:
+            Avec read_existing, tags présents avant l'injection sous les noms de
+            clés FFmpeg (lus dans l'atome ilst déjà chargé, sans analyse
+            supplémentaire); sinon un dictionnaire vide
+        """
+        video = MP4(path)
+        if video.tags is None:
+            video.add_tags()
+        
+        existing = {}
+        for atom, values in (video.tags.items() if read_existing else ()):
+            if atom == 'covr':
+                continue  # Pochette: données binaires
+            if atom.startswith(MP4_FREEFORM_PREFIX):
+                key = atom[len(MP4_FREEFORM_PREFIX):]
+            else:
+                key = MP4_ATOM_TAGS.get(atom, atom)
+            existing[key] = OptimizedVideoMetadataProcessor._mp4_tag_value(values)
+        
+        for key, value in metadata.items():
+            atom = MP4_TAG_ATOMS.get(key.lower())
+            if atom:
+                video.tags[atom] = [value]
+            else:
+                video.tags[MP4_FREEFORM_PREFIX + key] = [MP4FreeForm(value.encode('utf-8'))]
+        
+        video.save()
+        return existing
+    
+    @staticmethod
+    def _inject_matroska_tags(
+        path: str,
+        metadata: Dict[str, str],
+        read_existing: bool = False
+    ) -> Dict[str, str]:
+        """
+        Réécrit les tags globaux d'un fichier MKV/WebM via mkvtoolnix
+        
+        Les tags existants sont extraits (mkvextract), fusionnés avec les nouveaux
+        puis réécrits par mkvpropedit, qui modifie l'élément Tags sur place.
+        Comme FFmpeg, 'title' est écrit dans le segment Info et les noms de tags
+        sont en majuscules.
+        
+        Returns:
+            Avec read_existing, tags globaux présents avant l'injection
+            (extraits par mkvextract) et titre du segment Info (lu par
+            'mkvmerge -J', s'il est installé); sinon un dictionnaire vide
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tags_file = os.path.join(tmp_dir, 'tags.xml')
+            _run_command(['mkvextract', path, 'tags', tags_file], text=False,
+                         ok_returncodes=MKVTOOLNIX_OK_RETURNCODES)
+            
+            if os.path.exists(tags_file) and os.path.getsize(tags_file) > 0:
+                extracted = ET.parse(tags_file).getroot()
+            else:
+                extracted = ET.Element('Tags')
+            
+            # Seuls les tags globaux (TargetTypeValue 50 ou sans cible, sans UID de
+            # piste) sont réécrits: '--tags global:' ne remplace que ceux-là et les
+            # tags par piste (BPS, DURATION... de mkvmerge) restent intacts
+            root = ET.Element('Tags')
+            for tag in extracted.findall('Tag'):
+                targets = tag.find('Targets')
+                if targets is None or (
+                    not any(child.tag.endswith('UID') for child in targets)
+                    and targets.findtext('TargetTypeValue', '50') == '50'
+                ):
+                    root.append(tag)
+            
+            existing = {
+                simple.findtext('Name'): simple.findtext('String') or ''
+                for tag in root.findall('Tag')
+                for simple in tag.findall('Simple')
+                if simple.findtext('Name')
+            } if read_existing else {}
+            if read_existing and _find_executable('mkvmerge'):
+                # 'title' est dans le segment Info, hors de l'élément Tags extrait
+                identification = json.loads(_run_command(
+                    ['mkvmerge', '-J', path], ok_returncodes=MKVTOOLNIX_OK_RETURNCODES
+                ).stdout)
+                title = identification.get('container', {}).get('properties', {}).get('title')
+                if title is not None:
+                    existing['title'] = title
+            
+            # Nouvelles valeurs dans le premier tag global (créé s'il n'existe pas)
+            global_tag = root.find('Tag')
+            if global_tag is None:
+                global_tag = ET.SubElement(root, 'Tag')
+                ET.SubElement(ET.SubElement(global_tag, 'Targets'), 'TargetTypeValue').text = '50'
+            
+            cmd = ['mkvpropedit', path]
+            for key, value in metadata.items():
+                if key.lower() == 'title':
+                    cmd.extend(['--edit', 'info', '--set', f'title={value}'])
+                    continue
+                name = key.upper()
+                simple = next(
+                    (item for item in global_tag.findall('Simple')
+                     if (item.findtext('Name') or '').upper() == name),
+                    None
+                )
+                if simple is None:
+                    simple = ET.SubElement(global_tag, 'Simple')
+                    ET.SubElement(simple, 'Name').text = name
+                string = simple.find('String')
+                if string is None:
+                    string = ET.SubElement(simple, 'String')
+                string.text = value
+            
+            if len(global_tag.findall('Simple')) > 0:
+                ET.ElementTree(root).write(tags_file, encoding='utf-8', xml_declaration=True)
+                cmd.extend(['--tags', f'global:{tags_file}'])
+            
+            _run_command(cmd, text=False, ok_returncodes=MKVTOOLNIX_OK_RETURNCODES)
+        return existing
+    
+    @staticmethod
+    def _build_metadata_args(metadata: Dict[str, str]) -> List[str]:
+        """
+        Construit les arguments '-metadata key=value' pour FFmpeg
+        
+        OPTIMISATION: Liste construite en une compréhension.
+        Les valeurs sont passées telles quelles: FFmpeg reçoit argv sans shell
+        et n'interprète aucun échappement, la sortie porte donc exactement les
+        mêmes octets que l'injection directe (mutagen / mkvpropedit).
+        """
+        return [
+            arg
+            for key, value in metadata.items()
+            for arg in ('-metadata', f'{key}={value}')
+        ]
+    
+    @staticmethod
+    def _stream_map_args(index: int) -> List[str]:
+        """
+        Streams de l'entrée `index` copiés dans sa sortie (commande simple et groupée)
+        
+        Toutes les pistes vidéo, audio et sous-titres sont conservées. La sortie
+        a toujours le conteneur de la source: ses sous-titres y sont acceptés.
+        """
+        return ['-map', f'{index}:v?', '-map', f'{index}:a?', '-map', f'{index}:s?']
+    
+    @staticmethod
+    def _unknown_metadata_keys(metadata: Dict[str, str]) -> List[str]:
+        """
+        Liste les clés ni standard FFmpeg ni suggérées par l'application
+        
+        OPTIMISATION: Différence d'ensembles contre un frozenset construit à
+        l'import, une seule fois par lot (les métadonnées sont communes).
+        """
+        return sorted({key.lower() for key in metadata} - _KNOWN_METADATA_KEYS)
+    
+    @staticmethod
+    def _discard_partial(job: JobSpec) -> None:
+        """Supprime la sortie partielle d'un traitement échoué (si elle existe)"""
+        try:
+            os.unlink(job.partial_file)
+        except FileNotFoundError:
+            pass
+    
+    def _copy_and_inject_inplace(
+        self,
+        job: JobSpec,
         metadata: Dict[str, str]
+    ) -> Optional[Dict[str, str]]:
+        """
+        Chemin rapide bloquant: copie la source puis injecte sur place la sortie
+        
+        Le conteneur vient du JobSpec: aucun en-tête n'est relu ici, ni sur la
+        copie (mêmes octets que la source). La copie est écrite sous
+        job.partial_file puis renommée (os.replace): une sortie interrompue
+        n'est jamais prise pour une sortie à jour.
+        
+        Returns:
+            Tags d'origine si l'injection directe a réussi, None s'il faut passer
+            par FFmpeg (conteneur non éligible: aucune copie n'est alors faite)
+        """
+        if job.container is None:
+            return None
+        
+        try:
+            same_file = os.path.samefile(job.input_file, job.output_file)
+        except FileNotFoundError:
+            same_file = False
+        if same_file:
+            # Sortie = source: modification directe sur place
+            return self._inject_metadata_inplace(job.output_file, metadata, job.container)
+        
+        try:
+            _copy_file_fast(job.input_file, job.partial_file)
+            existing = self._inject_metadata_inplace(job.partial_file, metadata, job.container)
+        except BaseException:
+            self._discard_partial(job)
+            raise
+        
+        if existing is None:
+            self._discard_partial(job)
+        else:
+            os.replace(job.partial_file, job.output_file)
+        return existing
+    
+    async def _process_single_video(
+        self,
+        job: JobSpec,
+        metadata: Dict[str, str],
+        metadata_args: Optional[List[str]] = None
     ) -> VideoProcessingResult:
         """
-        Traite une seule vidéo (fonction thread-safe pour parallélisation)
+        Traite une seule vidéo (coroutine, exécutée en parallèle par process_batch)
+        
+        Chemin rapide: pour MP4/MOV et MKV/WebM, le fichier est copié (copie
+        noyau, sans passer par l'espace utilisateur) puis ses métadonnées sont
+        réécrites sur place, dans l'exécuteur par défaut de la boucle (bloquant).
+        FFmpeg n'est utilisé qu'en repli, via asyncio.create_subprocess_exec.
+        Avec read_existing, les tags d'origine viennent de l'injection directe
+        (déjà lus pour la fusion), ou du remux qui écrit la sortie et lit les
+        tags source dans le même FFmpeg.
         
         OPTIMISATIONS FFmpeg utilisées:
+            -map 0:v?/a?/s?  : Toutes les pistes vidéo/audio/sous-titres
             -c copy          : Copie directe des streams (pas de réencodage)
             -map_metadata 0  : Préserve les métadonnées existantes
-            -threads 0       : Utilise tous les CPU disponibles
+            -threads N       : Budget de threads par processus (CPU / workers)
             -y               : Écrase sans confirmation
         
         Args:
-            input_file: Chemin du fichier source
-            output_file: Chemin du fichier destination
+            job: Description du fichier à traiter (chemins, nom, taille source)
             metadata: Dictionnaire des métadonnées à injecter
+            metadata_args: Arguments '-metadata' précalculés pour tout le lot
+                           (calculés depuis metadata si absents)
             
         Returns:
             VideoProcessingResult avec statistiques
         """
         start_time = time.time()
+        if metadata_args is None:
+            metadata_args = self._build_metadata_args(metadata)
+        existing_tags = None
         
         try:
-            # Vérifications préliminaires
-            if not os.path.exists(input_file):
-                raise FileNotFoundError(f"Fichier introuvable: {input_file}")
-            
-            file_size_before = os.path.getsize(input_file)
-            
-            # Construction de la commande FFmpeg optimisée
-            cmd = [
-                'ffmpeg',
-                '-i', input_file,           # Input
-                '-map_metadata', '0',       # Préserve métadonnées existantes
-                '-c', 'copy',               # Mode copie (pas de réencodage)
-                '-threads', '0',            # Multi-threading auto
-            ]
-            
-            # Injection des métadonnées personnalisées
-            for key, value in metadata.items():
-                # Échappement des caractères spéciaux pour la ligne de commande
-                safe_value = value.replace('"', '\\"').replace('\n', '\\n')
-                cmd.extend(['-metadata', f'{key}={safe_value}'])
-            
-            cmd.extend([
-                '-y',                       # Écrasement automatique
-                output_file
-            ])
-            
-            # Exécution avec capture des erreurs
-            if self.verbose:
-                logger.debug(f"Commande FFmpeg: {' '.join(cmd)}")
-            
-            result = subprocess.run(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                check=True
+            loop = asyncio.get_running_loop()
+            inplace_tags = await loop.run_in_executor(
+                None, self._copy_and_inject_inplace, job, metadata
             )
+            if inplace_tags is not None:
+                file_size_after = os.stat(job.output_file).st_size
+                duration = time.time() - start_time
+                
+                logger.info(f"✓ Traité (direct): {job.basename} "
+                           f"({job.size_before / 1024 / 1024:.2f} MB) "
+                           f"en {duration:.2f}s")
+                
+                return VideoProcessingResult(
+                    input_file=job.input_file,
+                    output_file=job.output_file,
+                    success=True,
+                    duration=duration,
+                    file_size_before=job.size_before,
+                    file_size_after=file_size_after,
+                    existing_tags=inplace_tags if self.read_existing else None
+                )
             
-            # Vérification post-traitement
-            if not os.path.exists(output_file):
-                raise RuntimeError("Fichier de sortie non créé")
+            if self.read_existing:
+                # Remux: lecture des tags existants et écriture fusionnées (un seul FFmpeg)
+                existing_tags = await self._process_and_read(job, metadata_args)
+            else:
+                # Construction de la commande FFmpeg optimisée (une seule liste)
+                cmd = [
+                    'ffmpeg',
+                    '-i', job.input_file,       # Input
+                    *self._stream_map_args(0),  # Mêmes pistes qu'en groupé
+                    '-map_metadata', '0',       # Préserve métadonnées existantes
+                    '-c', 'copy',               # Mode copie (pas de réencodage)
+                    '-threads', str(self.threads_per_invocation),  # Budget CPU par processus
+                    *metadata_args,             # Métadonnées personnalisées
+                    '-y',                       # Écrasement automatique
+                    job.partial_file            # Renommé en output_file si succès
+                ]
+                
+                # Exécution avec capture des erreurs (commande formatée seulement si affichée)
+                if self.verbose and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Commande FFmpeg: %s", ' '.join(cmd))
+                
+                await _run_command_async(cmd)
             
-            file_size_after = os.path.getsize(output_file)
+            # Vérification post-traitement (un seul stat: existence + taille)
+            try:
+                file_size_after = os.stat(job.partial_file).st_size
+            except FileNotFoundError:
+                raise RuntimeError("Fichier de sortie non créé") from None
+            os.replace(job.partial_file, job.output_file)
             duration = time.time() - start_time
             
-            logger.info(f"✓ Traité: {os.path.basename(input_file)} "
-                       f"({file_size_before / 1024 / 1024:.2f} MB) "
+            logger.info(f"✓ Traité: {job.basename} "
+                       f"({job.size_before / 1024 / 1024:.2f} MB) "
                        f"en {duration:.2f}s")
             
             return VideoProcessingResult(
-                input_file=input_file,
-                output_file=output_file,
+                input_file=job.input_file,
+                output_file=job.output_file,
                 success=True,
                 duration=duration,
-                file_size_before=file_size_before,
-                file_size_after=file_size_after
+                file_size_before=job.size_before,
+                file_size_after=file_size_after,
+                existing_tags=existing_tags
             )
             
         except Exception as e:
+            self._discard_partial(job)
             duration = time.time() - start_time
-            error_msg = str(e)
-            logger.error(f"✗ Échec: {os.path.basename(input_file)} - {error_msg}")
+            return self._failed_result(job.input_file, job.output_file, e, duration)
+    
+    async def _process_and_read(self, job: JobSpec, metadata_args: List[str]) -> Dict[str, str]:
+        """
+        Écrit la sortie taguée et renvoie les tags existants de la source
+        
+        OPTIMISATION: Fusion lecture + écriture en une seule invocation FFmpeg
+        à deux sorties (fichier tagué + dump ffmetadata sur stdout) au lieu
+        d'un ffprobe puis d'un ffmpeg: un fork et une analyse du conteneur
+        en moins (coûteuse pour les MP4 longs, tables stco volumineuses).
+        
+        Raises:
+            subprocess.CalledProcessError: si FFmpeg échoue
+        """
+        cmd = [
+            'ffmpeg',
+            '-i', job.input_file,
+            # Sortie 1: fichier tagué
+            *self._stream_map_args(0),
+            '-map_metadata', '0',
+            '-c', 'copy',
+            '-threads', str(self.threads_per_invocation),
+            *metadata_args,
+            '-y',
+            job.partial_file,
+            # Sortie 2: tags source (bitexact: pas de tag 'encoder' ajouté par FFmpeg)
+            '-map_metadata', '0',
+            '-fflags', '+bitexact',
+            '-f', 'ffmetadata',
+            'pipe:1'
+        ]
+        
+        if self.verbose and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Commande FFmpeg (lecture + écriture): %s", ' '.join(cmd))
+        
+        result = await _run_command_async(cmd)
+        return self._parse_ffmetadata(result.stdout)
+    
+    @staticmethod
+    def _parse_ffmetadata(output: str) -> Dict[str, str]:
+        """
+        Extrait les tags globaux d'un dump au format ffmetadata (;FFMETADATA1)
+        
+        Les caractères '=', ';', '#', '\\' et retour à la ligne sont échappés
+        par '\\'. Lecture arrêtée à la première section ([CHAPTER], [STREAM]).
+        """
+        tags = {}
+        key, value, current = None, [], []
+        escaped = comment = False
+        
+        for char in output + '\n':
+            if char == '\n' and not escaped:
+                if key is not None:
+                    tags[key] = ''.join(value)
+                elif current and current[0] == '[':
+                    break
+                key, value, current = None, [], []
+                comment = False
+            elif comment:
+                continue
+            elif escaped:
+                current.append(char)
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char in ';#' and key is None and not current:
+                comment = True  # Ligne de commentaire (dont l'en-tête ;FFMETADATA1)
+            elif char == '=' and key is None:
+                key, current = ''.join(current), value
+            else:
+                current.append(char)
+        
+        return tags
+    
+    @staticmethod
+    def _failed_result(
+        input_file: str,
+        output_file: str,
+        error: Exception,
+        duration: float = 0.0
+    ) -> VideoProcessingResult:
+        """Journalise un échec et construit le VideoProcessingResult correspondant"""
+        error_msg = str(error)
+        logger.error(f"✗ Échec: {os.path.basename(input_file)} - {error_msg}")
+        
+        return VideoProcessingResult(
+            input_file=input_file,
+            output_file=output_file,
+            success=False,
+            duration=duration,
+            error_message=error_msg
+        )
+    
+    async def _process_video_group(
+        self,
+        jobs: List[JobSpec],
+        metadata: Dict[str, str],
+        metadata_args: Optional[List[str]] = None
+    ) -> List[VideoProcessingResult]:
+        """
+        Traite plusieurs vidéos courtes dans une seule invocation FFmpeg
+        
+        OPTIMISATION: Un seul fork/exec et un seul chargement de FFmpeg pour
+        tout le groupe au lieu d'un processus par fichier (~50-200 ms chacun).
+        Chaque entrée i est écrite dans sa sortie i avec ses propres streams
+        (_stream_map_args), métadonnées (-map_metadata i) et chapitres
+        (-map_chapters i).
+        Les sorties sont écrites sous job.partial_file puis renommées une fois
+        FFmpeg terminé. En cas d'échec du groupe, les sorties partielles sont
+        supprimées et chaque fichier est retraité individuellement.
+        
+        Args:
+            jobs: Fichiers du groupe
+            metadata: Dictionnaire des métadonnées à injecter
+            metadata_args: Arguments '-metadata' précalculés pour tout le lot
             
-            return VideoProcessingResult(
-                input_file=input_file,
-                output_file=output_file,
-                success=False,
-                duration=duration,
-                error_message=error_msg
-            )
+        Returns:
+            Liste des VideoProcessingResult (un par fichier)
+        """
+        if metadata_args is None:
+            metadata_args = self._build_metadata_args(metadata)
+        if len(jobs) == 1:
+            return [await self._process_single_video(jobs[0], metadata, metadata_args)]
+        
+        start_time = time.time()
+        
+        cmd = ['ffmpeg']
+        for job in jobs:
+            cmd.extend(['-i', job.input_file])
+        for index, job in enumerate(jobs):
+            cmd.extend([
+                *self._stream_map_args(index),
+                '-map_metadata', str(index),
+                '-map_chapters', str(index),   # Sinon: chapitres de la 1re entrée partout
+                '-c', 'copy',
+                '-threads', str(self.threads_per_invocation),
+                *metadata_args,
+                '-y',
+                job.partial_file
+            ])
+        
+        if self.verbose and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Commande FFmpeg groupée: %s", ' '.join(cmd))
+        
+        try:
+            await _run_command_async(cmd)
+            results = []
+            duration = (time.time() - start_time) / len(jobs)
+            for job in jobs:
+                file_size_after = os.stat(job.partial_file).st_size
+                os.replace(job.partial_file, job.output_file)
+                
+                logger.info(f"✓ Traité (groupé): {job.basename} "
+                           f"({job.size_before / 1024 / 1024:.2f} MB) "
+                           f"en {duration:.2f}s")
+                
+                results.append(VideoProcessingResult(
+                    input_file=job.input_file,
+                    output_file=job.output_file,
+                    success=True,
+                    duration=duration,
+                    file_size_before=job.size_before,
+                    file_size_after=file_size_after
+                ))
+            return results
+            
+        except (subprocess.CalledProcessError, OSError) as e:
+            for job in jobs:
+                self._discard_partial(job)
+            logger.warning(f"⚠ Échec du groupe de {len(jobs)} fichiers, traitement individuel")
+            logger.debug("Erreur FFmpeg groupée: %s", e)
+            return [
+                await self._process_single_video(job, metadata, metadata_args)
+                for job in jobs
+            ]
+    
+    def _group_jobs(self, jobs: List[JobSpec], workers: int) -> List[List[JobSpec]]:
+        """
+        Répartit les fichiers en groupes: fichiers courts regroupés, autres isolés
+        
+        Seuls les fichiers sous SMALL_FILE_THRESHOLD et non éligibles à
+        l'injection directe sont regroupés. La taille des groupes est réduite
+        pour que tous les workers restent occupés.
+        Avec read_existing, aucun groupe n'est formé: le dump des tags sur
+        stdout d'un remux ne peut pas être réparti entre plusieurs sorties.
+        """
+        groups = []
+        small_jobs = []
+        for job in jobs:
+            if job.size_before < SMALL_FILE_THRESHOLD and job.container is None and not self.read_existing:
+                small_jobs.append(job)
+            else:
+                groups.append([job])
+        
+        if small_jobs:
+            group_size = min(FFMPEG_GROUP_SIZE, math.ceil(len(small_jobs) / workers))
+            for start in range(0, len(small_jobs), group_size):
+                groups.append(small_jobs[start:start + group_size])
+        return groups
+    
+    async def _check_up_to_date(
+        self,
+        job: JobSpec,
+        metadata: Dict[str, str]
+    ) -> Optional[VideoProcessingResult]:
+        """
+        Vérifie si la sortie existe déjà avec les métadonnées demandées
+        
+        OPTIMISATION: Un ffprobe (~20 ms) évite un remux complet (1-10 s) lors
+        d'une relance sur un dossier déjà traité. ffprobe n'est lancé que si la
+        sortie existe et est plus récente que la source.
+        
+        Returns:
+            VideoProcessingResult 'skipped' si la sortie est à jour, sinon None
+        """
+        try:
+            output_stat = os.stat(job.output_file)
+        except OSError:
+            return None
+        if output_stat.st_mtime < job.mtime_before:
+            return None
+        
+        try:
+            result = await _run_command_async(self._ffprobe_format_cmd(job.output_file))
+            output_tags = self._parse_ffprobe_tags(result.stdout)
+        except (subprocess.CalledProcessError, OSError, ValueError):
+            return None
+        existing = {key.lower(): value for key, value in output_tags.items()}
+        
+        # Remux FFmpeg et injection directe écrivent la même valeur brute
+        for key, value in metadata.items():
+            if existing.get(key.lower()) != value:
+                return None
+        
+        logger.info(f"↷ Déjà à jour: {job.basename}")
+        return VideoProcessingResult(
+            input_file=job.input_file,
+            output_file=job.output_file,
+            success=True,
+            duration=0.0,
+            file_size_before=job.size_before,
+            file_size_after=output_stat.st_size,
+            skipped=True,
+            existing_tags=output_tags if self.read_existing else None
+        )
+    
+    async def _run_batch(
+        self,
+        jobs: List[JobSpec],
+        metadata: Dict[str, str],
+        metadata_args: List[str],
+        workers: int
+    ) -> List[VideoProcessingResult]:
+        """
+        Exécute le lot dans une seule boucle asyncio, au plus `workers` tâches à la fois
+        
+        Les sorties déjà à jour sont d'abord détectées (ffprobe concurrents) et
+        retirées du lot, puis les fichiers restants sont regroupés et traités.
+        
+        Returns:
+            Résultats de tous les fichiers (ignorés puis traités)
+        """
+        semaphore = asyncio.Semaphore(workers)
+        results = []
+        
+        if self.skip_up_to_date:
+            async def check(job: JobSpec) -> Optional[VideoProcessingResult]:
+                async with semaphore:
+                    return await self._check_up_to_date(job, metadata)
+            
+            checks = await asyncio.gather(*(check(job) for job in jobs))
+            results.extend(result for result in checks if result is not None)
+            jobs = [job for job, result in zip(jobs, checks) if result is None]
+        
+        async def run_group(group: List[JobSpec]) -> List[VideoProcessingResult]:
+            async with semaphore:
+                return await self._process_video_group(group, metadata, metadata_args)
+        
+        groups = self._group_jobs(jobs, workers)
+        group_results = await asyncio.gather(*(run_group(group) for group in groups))
+        results.extend(result for group in group_results for result in group)
+        return results
+    
+    def _prepare_jobs(
+        self,
+        video_files: List[str],
+        output_dir: Optional[str],
+        suffix: str
+    ) -> Tuple[List[JobSpec], List[VideoProcessingResult]]:
+        """
+        Prépare les jobs: chemins de sortie, nom, taille et conteneur de chaque source
+        
+        OPTIMISATION: Un seul os.stat, un seul découpage de chemin et une seule
+        lecture d'en-tête (détection du conteneur) par fichier; les étapes
+        suivantes relisent les champs du JobSpec sans re-parser.
+        La sortie partielle est un fichier caché du dossier de sortie (même
+        système de fichiers: os.replace est atomique), avec la même extension
+        pour que FFmpeg choisisse le bon format.
+        
+        Returns:
+            (jobs à traiter, résultats en échec pour les sources illisibles)
+        """
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        
+        jobs = []
+        failures = []
+        for input_file in video_files:
+            directory, basename = os.path.split(input_file)
+            stem, extension = os.path.splitext(basename)
+            output_directory = output_dir or directory
+            output_file = os.path.join(output_directory, f"{stem}{suffix}{extension}")
+            partial_file = os.path.join(output_directory, f".{stem}{suffix}.partial{extension}")
+            
+            try:
+                input_stat = os.stat(input_file)
+            except FileNotFoundError:
+                failures.append(self._failed_result(
+                    input_file, output_file, FileNotFoundError(f"Fichier introuvable: {input_file}")
+                ))
+                continue
+            except OSError as e:
+                failures.append(self._failed_result(input_file, output_file, e))
+                continue
+            
+            try:
+                container = self._inplace_container(input_file)
+            except OSError:
+                container = None  # Illisible: l'erreur remontera du traitement FFmpeg
+            
+            jobs.append(JobSpec(
+                input_file, output_file, basename, input_stat.st_size, input_stat.st_mtime,
+                container, partial_file
+            ))
+        return jobs, failures
     
     def process_batch(
         self,
@@ -274,8 +1402,13 @@ class OptimizedVideoMetadataProcessor:
         """
         Traite un lot de vidéos en parallèle
         
-        OPTIMISATION: Utilise ThreadPoolExecutor pour traitement multi-thread
-        Chaque vidéo est traitée dans un thread séparé, maximisant l'utilisation CPU
+        OPTIMISATION: Ordonnancement asyncio sur un seul thread
+        Les fichiers dont la sortie porte déjà les métadonnées sont ignorés.
+        Chaque job (une vidéo, ou un groupe de vidéos courtes traitées par un
+        seul processus FFmpeg) est une coroutine; un sémaphore borne le nombre de
+        jobs simultanés, sans thread bloqué par processus FFmpeg. Le nombre de workers est
+        limité au nombre de fichiers et les CPU sont répartis entre les processus
+        FFmpeg (workers × threads ≈ nombre de CPU) pour éviter la surcharge.
         
         Args:
             video_files: Liste des chemins des vidéos à traiter
@@ -286,54 +1419,59 @@ class OptimizedVideoMetadataProcessor:
         Returns:
             Liste des résultats de traitement
         """
+        # Mode copy = charge I/O: inutile de lancer plus de workers que de fichiers
+        workers = max(1, min(self.max_workers, len(video_files)))
+        self.threads_per_invocation = self._threads_for_workers(workers)
+        
         logger.info(f"\n{'═' * 80}")
         logger.info(f"TRAITEMENT PAR LOTS")
         logger.info(f"{'═' * 80}")
         logger.info(f"Fichiers à traiter: {len(video_files)}")
-        logger.info(f"Threads parallèles: {self.max_workers}")
+        logger.info(f"Threads parallèles: {workers}")
+        logger.info(f"Threads par FFmpeg: {self.threads_per_invocation}")
         logger.info(f"Métadonnées: {len(metadata)} champs")
         logger.info(f"{'═' * 80}\n")
         
-        results = []
+        # Une faute de frappe (ex: 'artst') est acceptée en silence par FFmpeg
+        unknown_keys = self._unknown_metadata_keys(metadata)
+        if unknown_keys:
+            logger.warning(
+                f"⚠ Clés de métadonnées non standard (faute de frappe ?): {', '.join(unknown_keys)}"
+            )
         
-        # Préparation des tâches
-        tasks = []
-        for input_file in video_files:
-            input_path = Path(input_file)
-            
-            if output_dir:
-                output_path = Path(output_dir) / f"{input_path.stem}{suffix}{input_path.suffix}"
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-            else:
-                output_path = input_path.parent / f"{input_path.stem}{suffix}{input_path.suffix}"
-            
-            tasks.append((input_file, str(output_path), metadata))
-        
-        # Exécution parallèle avec ThreadPoolExecutor
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Soumission de toutes les tâches
-            future_to_task = {
-                executor.submit(self._process_single_video, *task): task
-                for task in tasks
-            }
-            
-            # Collecte des résultats au fur et à mesure
-            for future in as_completed(future_to_task):
-                result = future.result()
-                results.append(result)
-                
-                # Mise à jour des statistiques
-                self.stats.total_files += 1
-                if result.success:
-                    self.stats.successful += 1
-                    self.stats.total_size_before += result.file_size_before
-                    self.stats.total_size_after += result.file_size_after
-                else:
-                    self.stats.failed += 1
-                self.stats.total_duration += result.duration
+        # Préparation des jobs (sources introuvables: échec immédiat)
+        jobs, results = self._prepare_jobs(video_files, output_dir, suffix)
+        
+        # Métadonnées identiques pour tout le lot: arguments FFmpeg calculés une fois
+        metadata_args = self._build_metadata_args(metadata)
+        
+        # Exécution parallèle (boucle asyncio, concurrence bornée à `workers`)
+        results.extend(asyncio.run(self._run_batch(jobs, metadata, metadata_args, workers)))
+        
+        # Mise à jour des statistiques en une passe, hors de la boucle de collecte
+        functools.reduce(ProcessingStats.add_result, results, self.stats)
         
         return results
     
+    @staticmethod
+    def _ffprobe_format_cmd(video_file: str) -> List[str]:
+        """Commande ffprobe de lecture des informations du conteneur (JSON)"""
+        return [
+            'ffprobe',
+            '-v', 'quiet',
+            '-print_format', 'json',
+            '-show_format',
+            video_file
+        ]
+    
+    @staticmethod
+    def _parse_ffprobe_tags(output: str) -> Dict[str, str]:
+        """Extrait les tags globaux de la sortie JSON de ffprobe -show_format"""
+        data = json.loads(output)
+        if 'format' in data and 'tags' in data['format']:
+            return data['format']['tags']
+        return {}
+    
     def read_metadata(self, video_file: str) -> Dict[str, str]:
         """
         Lit les métadonnées existantes d'une vidéo
@@ -346,31 +1484,23 @@ class OptimizedVideoMetadataProcessor:
         Returns:
             Dictionnaire des métadonnées
         """
-        cmd = [
-            'ffprobe',
-            '-v', 'quiet',
-            '-print_format', 'json',
-            '-show_format',
-            video_file
-        ]
-        
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            data = json.loads(result.stdout)
-            
-            if 'format' in data and 'tags' in data['format']:
-                return data['format']['tags']
-            return {}
+            result = _run_command(self._ffprobe_format_cmd(video_file))
+            return self._parse_ffprobe_tags(result.stdout)
             
         except Exception as e:
             logger.error(f"Erreur lecture métadonnées: {e}")
             return {}
     
+    def compute_checksums(
+        self,
+        files: List[str],
+        strict: bool = False,
+        algorithm: str = HASH_ALGORITHM
+    ) -> Dict[str, Optional[str]]:
+        """Calcule les empreintes d'intégrité d'une liste de fichiers (voir compute_checksums)"""
+        return compute_checksums(files, strict=strict, algorithm=algorithm)
+    
     def print_statistics(self) -> None:
         """Affiche les statistiques de traitement"""
         logger.info(f"\n{'═' * 80}")
@@ -379,6 +1509,8 @@ class OptimizedVideoMetadataProcessor:
         logger.info(f"Total fichiers traités:  {self.stats.total_files}")
         logger.info(f"  ✓ Succès:              {self.stats.successful}")
         logger.info(f"  ✗ Échecs:              {self.stats.failed}")
+        if self.stats.skipped > 0:
+            logger.info(f"  ↷ Déjà à jour:         {self.stats.skipped}")
         
         if self.stats.successful > 0:
             logger.info(f"Taille totale avant:     {self.stats.total_size_before / 1024 / 1024:.2f} MB")
@@ -397,6 +1529,39 @@ class OptimizedVideoMetadataProcessor:
 # MODE INTERACTIF
 # ═══════════════════════════════════════════════════════════════════════════
 
+def _collect_video_files(folder: str) -> List[str]:
+    """
+    Liste les fichiers vidéo d'un dossier (non récursif)
+    
+    OPTIMISATION: os.scandir fournit le type de chaque entrée sans stat
+    supplémentaire, et l'extension est extraite par rpartition sans créer
+    d'objet Path par fichier. Les fichiers cachés (dont les sorties partielles
+    d'un traitement interrompu) sont ignorés.
+    """
+    video_files = []
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            name, _, extension = entry.name.rpartition('.')
+            if name and not name.startswith('.') and extension.lower() in VIDEO_EXTENSIONS and entry.is_file():
+                video_files.append(entry.path)
+    return video_files
+
+
+def _print_metadata(source: str, metadata: Dict[str, str]) -> None:
+    """Affiche les métadonnées d'un fichier sous forme de bloc encadré"""
+    print(f"\n{'═' * 80}")
+    print(f"MÉTADONNÉES DE: {source}")
+    print(f"{'═' * 80}")
+    
+    if metadata:
+        for key, value in metadata.items():
+            print(f"  {key}: {value}")
+    else:
+        print("  Aucune métadonnée trouvée")
+    
+    print(f"{'═' * 80}\n")
+
+
 def interactive_mode():
     """Mode interactif avec interface utilisateur guidée"""
     print(f"""
@@ -431,9 +1596,11 @@ def interactive_mode():
             return
             
     elif choice == "2":
-        files_input = input("Chemins des fichiers (séparés par des virgules): ").strip()
+        files_input = input("Chemins des fichiers (séparés par des virgules): ")
         for file_path in files_input.split(','):
             file_path = file_path.strip()
+            if not file_path:
+                continue  # Virgule finale ou doublée
             if os.path.exists(file_path):
                 video_files.append(file_path)
             else:
@@ -442,10 +1609,7 @@ def interactive_mode():
     elif choice == "3":
         folder = input("Chemin du dossier: ").strip()
         if os.path.isdir(folder):
-            extensions = {'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v'}
-            for file in os.listdir(folder):
-                if Path(file).suffix.lower() in extensions:
-                    video_files.append(os.path.join(folder, file))
+            video_files.extend(_collect_video_files(folder))
             print(f"✓ {len(video_files)} fichiers vidéo trouvés")
         else:
             print(f"✗ Dossier introuvable: {folder}")
@@ -467,20 +1631,7 @@ def interactive_mode():
     metadata = {}
     
     # Suggestions de champs
-    suggestions = [
-        ('title', 'Titre'),
-        ('artist', 'Créateur/Artiste'),
-        ('description', 'Description'),
-        ('tags', 'Tags (séparés par virgules)'),
-        ('hashtags', 'Hashtags (ex: #video #tutorial)'),
-        ('category', 'Catégorie'),
-        ('project', 'Nom du projet'),
-        ('comment', 'Commentaire'),
-        ('copyright', 'Copyright'),
-        ('date', 'Date (YYYY-MM-DD)'),
-    ]
-    
-    for key, label in suggestions:
+    for key, label in METADATA_FIELD_SUGGESTIONS:
         value = input(f"  {label}: ").strip()
         if value:
             metadata[key] = value
@@ -525,9 +1676,11 @@ def interactive_mode():
     print("\n📋 DÉTAILS DES RÉSULTATS:")
     print("─" * 80)
     for result in results:
-        status = "✓" if result.success else "✗"
+        status = "↷" if result.skipped else "✓" if result.success else "✗"
         print(f"{status} {os.path.basename(result.input_file)}")
-        if result.success:
+        if result.skipped:
+            print(f"   → {result.output_file} (déjà à jour)")
+        elif result.success:
             print(f"   → {result.output_file}")
             print(f"   Durée: {result.duration:.2f}s")
         else:
@@ -561,6 +1714,9 @@ EXEMPLES D'UTILISATION:
   
   # Lecture de métadonnées existantes
   python video_metadata.py --read video.mp4
+  
+  # Injection et affichage des métadonnées d'origine (un seul passage FFmpeg)
+  python video_metadata.py --read -i video.mp4 -m title="Test"
         """
     )
     
@@ -570,29 +1726,55 @@ EXEMPLES D'UTILISATION:
     parser.add_argument('-m', '--metadata', nargs='+', help='Métadonnées (format: key=value)')
     parser.add_argument('-s', '--suffix', default='_metadata', help='Suffixe pour fichiers de sortie')
     parser.add_argument('-t', '--threads', type=int, default=MAX_WORKERS, help='Nombre de threads parallèles')
-    parser.add_argument('--read', help='Lire les métadonnées d\'un fichier')
+    parser.add_argument('--ffmpeg-threads-per-invocation', type=int, default=None,
+                        help=f'Threads par processus FFmpeg (défaut: CPU / workers, borné à 1-{MAX_FFMPEG_THREADS})')
+    parser.add_argument('--remux', action='store_true',
+                        help='Toujours passer par FFmpeg (désactive l\'injection directe MP4/MKV)')
+    parser.add_argument('--force', action='store_true',
+                        help='Retraite même les fichiers dont la sortie a déjà les métadonnées demandées')
+    parser.add_argument('--read', nargs='?', const=True, metavar='FILE',
+                        help='Lire les métadonnées d\'un fichier (sans FILE, avec -i/-d et -m: '
+                             'affiche les tags d\'origine lors de l\'injection)')
+    parser.add_argument('--checksum', nargs='+', metavar='FILE',
+                        help='Affiche l\'empreinte d\'intégrité de fichier(s) (début + fin + taille)')
+    parser.add_argument('--strict-hash', action='store_true',
+                        help='Avec --checksum: hash complet du fichier (vérification cryptographique)')
+    parser.add_argument('--hash-algorithm', choices=['sha256', 'blake3'], default=HASH_ALGORITHM,
+                        help='Avec --strict-hash: algorithme du hash complet (blake3: pip install blake3)')
     parser.add_argument('-v', '--verbose', action='store_true', help='Mode verbeux')
     parser.add_argument('--version', action='version', version=f'%(prog)s {VERSION}')
     
     args = parser.parse_args()
     
-    # Mode lecture de métadonnées
-    if args.read:
+    # Mode verbeux: affiche aussi les messages de debug (commandes FFmpeg...)
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+    
+    # Mode lecture de métadonnées (--read FILE; --read seul = lecture + injection)
+    if isinstance(args.read, str):
         processor = OptimizedVideoMetadataProcessor(verbose=args.verbose)
-        metadata = processor.read_metadata(args.read)
+        _print_metadata(args.read, processor.read_metadata(args.read))
+        return
+    
+    # Mode calcul d'empreintes d'intégrité
+    if args.checksum:
+        if args.hash_algorithm == 'blake3' and blake3 is None:
+            parser.error("--hash-algorithm blake3 requiert le module blake3 (pip install blake3)")
+        
+        # Hash sans FFmpeg: pas de processeur (ni de vérification FFmpeg) à construire
+        checksums = compute_checksums(args.checksum, strict=args.strict_hash, algorithm=args.hash_algorithm)
+        algorithm = args.hash_algorithm if args.strict_hash else FINGERPRINT_ALGORITHM
+        method = f"{algorithm} complet" if args.strict_hash else f"{algorithm} début+fin+taille"
         
         print(f"\n{'═' * 80}")
-        print(f"MÉTADONNÉES DE: {args.read}")
+        print(f"EMPREINTES D'INTÉGRITÉ ({method})")
+        print(f"Backend: {_describe_hash_backend(algorithm)}")
         print(f"{'═' * 80}")
-        
-        if metadata:
-            for key, value in metadata.items():
-                print(f"  {key}: {value}")
-        else:
-            print("  Aucune métadonnée trouvée")
-        
+        for filepath, checksum in checksums.items():
+            print(f"  {checksum or 'ERREUR':<64}  {filepath}")
         print(f"{'═' * 80}\n")
-        return
+        
+        sys.exit(0 if all(checksums.values()) else 1)
     
     # Collecte des fichiers
     video_files = []
@@ -605,10 +1787,7 @@ EXEMPLES D'UTILISATION:
             logger.error(f"Dossier introuvable: {args.directory}")
             sys.exit(1)
         
-        extensions = {'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v'}
-        for file in os.listdir(args.directory):
-            if Path(file).suffix.lower() in extensions:
-                video_files.append(os.path.join(args.directory, file))
+        video_files.extend(_collect_video_files(args.directory))
     
     if not video_files:
         logger.error("Aucun fichier vidéo spécifié. Utilisez -i ou -d")
@@ -631,7 +1810,11 @@ EXEMPLES D'UTILISATION:
     # Traitement
     processor = OptimizedVideoMetadataProcessor(
         max_workers=args.threads,
-        verbose=args.verbose
+        verbose=args.verbose,
+        ffmpeg_threads=args.ffmpeg_threads_per_invocation,
+        inplace=not args.remux,
+        skip_up_to_date=not args.force,
+        read_existing=bool(args.read)
     )
     
     results = processor.process_batch(
@@ -641,6 +1824,12 @@ EXEMPLES D'UTILISATION:
         suffix=args.suffix
     )
     
+    # Tags d'origine récupérés pendant l'injection
+    for result in results:
+        if result.existing_tags is not None:
+            _print_metadata(result.output_file if result.skipped else result.input_file,
+                            result.existing_tags)
+    
     processor.print_statistics()
     
     # Code de sortie basé sur les résultats